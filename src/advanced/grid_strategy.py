@@ -5,10 +5,11 @@ Places multiple buy and sell limit orders at predetermined price levels.
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from concurrent.futures import ThreadPoolExecutor, as_completed
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 
-from binance.exceptions import BinanceAPIException
-from client import get_binance_client
 from validators import (
     validate_symbol, validate_quantity, validate_price,
     validate_positive_integer, ValidationError
@@ -17,7 +18,88 @@ from logger import setup_logger, log_order
 
 logger = setup_logger('GridStrategy')
 
-def setup_grid_strategy(symbol, quantity_per_grid, lower_price, upper_price, num_grids):
+# Maximum number of orders accepted by a single batchOrders request
+BATCH_SIZE = 5
+
+# Concurrent requests for the non-batched placement path
+MAX_WORKERS = 10
+
+def _place_batch_orders(client, leveled_params):
+    """
+    Place orders through the batchOrders endpoint, BATCH_SIZE orders per request.
+    
+    Args:
+        client: Authenticated Binance client
+        leveled_params (list): (grid level, order parameters) pairs
+        
+    Returns:
+        list: (level, params, response) triples; failed orders have a response with 'code' and 'msg'
+    """
+    import orjson
+    from binance.exceptions import BinanceAPIException
+    
+    placed = []
+    
+    for start in range(0, len(leveled_params), BATCH_SIZE):
+        levels, batch = zip(*leveled_params[start:start + BATCH_SIZE])
+        
+        try:
+            responses = client.futures_place_batch_order(batchOrders=orjson.dumps(batch).decode(), order_count=len(batch))
+        except BinanceAPIException as e:
+            # Whole batch rejected; report it against every order it contained
+            responses = [{'code': e.code, 'msg': e.message}] * len(batch)
+        
+        placed.extend(zip(levels, batch, responses))
+    
+    return placed
+
+def _place_orders_parallel(client, base_order, leveled_params, use_ws=None):
+    """
+    Place orders concurrently with one order request each.
+    
+    Used when the orders cannot go through batchOrders. Requests share the
+    client's pooled session and are paced by the shared order rate limiter.
+    
+    Args:
+        client: Authenticated Binance client
+        base_order (dict): Parameters shared by every order
+        leveled_params (list): (grid level, order parameters) pairs
+        use_ws (bool, optional): Send via the WebSocket trading API; defaults to USE_WS_TRADE_API
+        
+    Returns:
+        list: (level, params, response) triples; failed orders have a response with 'code'
+            and 'msg', plus 'status' UNKNOWN when the order was sent but never acknowledged
+    """
+    from binance.exceptions import BinanceAPIException
+    from client import OrderTemplate
+    from ws_client import create_order
+    
+    template = OrderTemplate(client, **base_order)
+    
+    def place(params):
+        return create_order(client, use_ws=use_ws, template=template, side=params['side'], price=params['price'])
+    
+    placed = []
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(place, params): (level, params) for level, params in leveled_params}
+        
+        for future in as_completed(futures):
+            level, params = futures[future]
+            try:
+                placed.append((level, params, future.result()))
+            except BinanceAPIException as e:
+                placed.append((level, params, {'code': e.code, 'msg': e.message}))
+            except TimeoutError as e:
+                # No acknowledgement; the order may or may not be on the book
+                placed.append((level, params, {'code': None, 'msg': str(e), 'status': 'UNKNOWN'}))
+            except OSError as e:
+                # Connection failures raised by requests and websockets are OSErrors
+                placed.append((level, params, {'code': None, 'msg': str(e)}))
+    
+    return placed
+
+def setup_grid_strategy(symbol, quantity_per_grid, lower_price, upper_price, num_grids, use_batch=True, use_ws=None):
     """
     Set up a grid trading strategy with buy and sell orders.
     
@@ -27,9 +109,12 @@ def setup_grid_strategy(symbol, quantity_per_grid, lower_price, upper_price, num
         lower_price (float): Lower bound price
         upper_price (float): Upper bound price
         num_grids (int): Number of grid levels
+        use_batch (bool): Send orders via batchOrders instead of concurrent single requests
+        use_ws (bool, optional): Send single requests via the WebSocket trading API
         
     Returns:
-        dict: Dictionary with buy and sell orders
+        dict: Dictionary with buy and sell orders, plus per-level arrays
+            order_ids, sides (1 buy, -1 sell, 0 none) and statuses aligned with grid_prices
         
     Raises:
         ValidationError: If input validation fails
@@ -45,9 +130,18 @@ def setup_grid_strategy(symbol, quantity_per_grid, lower_price, upper_price, num
     if upper_price <= lower_price:
         raise ValidationError(f"Upper price ({upper_price}) must be greater than lower price ({lower_price})")
     
+    # Imported here to keep CLI start-up fast
+    import numpy as np
+    from binance.exceptions import BinanceAPIException
+    from client import get_binance_client
+    import market_data
+    
+    # Start the quote stream now so it connects while the client is set up
+    market_data.subscribe(symbol)
+    
     # Calculate grid levels
     price_step = (upper_price - lower_price) / (num_grids - 1)
-    grid_prices = [lower_price + i * price_step for i in range(num_grids)]
+    grid_prices = np.linspace(lower_price, upper_price, num_grids)
     
     logger.info(f"Setting up grid strategy for {symbol}")
     logger.info(f"  Price range: {lower_price} - {upper_price}")
@@ -58,55 +152,91 @@ def setup_grid_strategy(symbol, quantity_per_grid, lower_price, upper_price, num
     try:
         client = get_binance_client()
         
-        # Get current market price
-        ticker = client.futures_symbol_ticker(symbol=symbol)
-        current_price = float(ticker['price'])
+        # Get current market price (streamed quote, or REST if none arrives in time)
+        try:
+            current_price = market_data.get_mid_price(client, symbol)
+        finally:
+            # The grid only needs the price once
+            market_data.stop()
         logger.info(f"Current market price: {current_price}")
         
+        # Buy below the market, sell above it; levels at the market price are skipped
+        buy_mask = grid_prices < current_price
+        sell_mask = grid_prices > current_price
+        
+        # Build one LIMIT order per grid level: all buys, then all sells
+        base_order = {
+            'symbol': symbol,
+            'type': 'LIMIT',
+            'timeInForce': 'GTC',
+            'quantity': str(quantity_per_grid)
+        }
+        # Each order carries the grid level it belongs to
+        buy_params = [
+            (level, dict(base_order, side='BUY', price=str(price)))
+            for level, price in zip(np.flatnonzero(buy_mask).tolist(), grid_prices[buy_mask].tolist())
+        ]
+        sell_params = [
+            (level, dict(base_order, side='SELL', price=str(price)))
+            for level, price in zip(np.flatnonzero(sell_mask).tolist(), grid_prices[sell_mask].tolist())
+        ]
+        
+        if use_batch:
+            # Buy and sell batches are independent, so send both sides concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                buys = executor.submit(_place_batch_orders, client, buy_params)
+                sells = executor.submit(_place_batch_orders, client, sell_params)
+                placed = buys.result() + sells.result()
+        else:
+            placed = _place_orders_parallel(client, base_order, buy_params + sell_params, use_ws=use_ws)
+        
         buy_orders = []
         sell_orders = []
         
-        # Place grid orders
-        for i, price in enumerate(grid_prices):
-            try:
-                if price < current_price:
-                    # Place buy order below current price
-                    order = client.futures_create_order(
-                        symbol=symbol,
-                        side='BUY',
-                        type='LIMIT',
-                        timeInForce='GTC',
-                        quantity=quantity_per_grid,
-                        price=price
-                    )
-                    buy_orders.append(order)
-                    logger.info(f"Buy order placed at {price}: {order.get('orderId')}")
-                    print(f"✓ Buy order {len(buy_orders)} placed at {price}")
-                    
-                elif price > current_price:
-                    # Place sell order above current price
-                    order = client.futures_create_order(
-                        symbol=symbol,
-                        side='SELL',
-                        type='LIMIT',
-                        timeInForce='GTC',
-                        quantity=quantity_per_grid,
-                        price=price
-                    )
-                    sell_orders.append(order)
-                    logger.info(f"Sell order placed at {price}: {order.get('orderId')}")
-                    print(f"✓ Sell order {len(sell_orders)} placed at {price}")
-                    
-            except BinanceAPIException as e:
-                logger.error(f"Error placing grid order at {price}: {e}")
-                print(f"✗ Error at price {price}: {e}")
-                # Continue with remaining orders
+        # Per-level results, indexed like grid_prices
+        order_ids = np.full(num_grids, -1, dtype=np.int64)
+        sides = np.zeros(num_grids, dtype=np.int8)
+        statuses = np.full(num_grids, '', dtype='U16')
+        
+        # Console lines are collected and written once after the loop
+        output_lines = []
+        
+        # Binance reports per-order failures inline instead of raising
+        for level, params, order in placed:
+            price = params['price']
+            
+            if 'code' in order:
+                statuses[level] = order.get('status', 'FAILED')
+                logger.error(f"Error placing grid order at {price}: {order.get('msg')}")
+                output_lines.append(f"✗ Error at price {price}: {order.get('msg')}")
+                continue
+            
+            order_ids[level] = order.get('orderId', -1)
+            statuses[level] = order.get('status', '')
+            
+            if order.get('side') == 'BUY':
+                sides[level] = 1
+                buy_orders.append(order)
+                logger.info(f"Buy order placed at {price}: {order.get('orderId')}")
+                output_lines.append(f"✓ Buy order {len(buy_orders)} placed at {price}")
+                
+            else:
+                sides[level] = -1
+                sell_orders.append(order)
+                logger.info(f"Sell order placed at {price}: {order.get('orderId')}")
+                output_lines.append(f"✓ Sell order {len(sell_orders)} placed at {price}")
+        
+        if output_lines:
+            sys.stdout.write('\n'.join(output_lines) + '\n')
         
         result = {
             'buy_orders': buy_orders,
             'sell_orders': sell_orders,
-            'grid_prices': grid_prices,
-            'current_price': current_price
+            'grid_prices': grid_prices.tolist(),
+            'current_price': current_price,
+            'order_ids': order_ids,
+            'sides': sides,
+            'statuses': statuses
         }
         
         log_order(
@@ -156,6 +286,9 @@ def main():
         print("  - Each order will be for 0.01 BTC")
         sys.exit(1)
     
+    import numpy as np
+    from binance.exceptions import BinanceAPIException
+    
     symbol = sys.argv[1]
     quantity_per_grid = sys.argv[2]
     lower_price = sys.argv[3]
@@ -176,10 +309,15 @@ def main():
         print(f"Sell orders placed: {len(result['sell_orders'])}")
         print(f"Total orders: {len(result['buy_orders']) + len(result['sell_orders'])}")
         
-        print("\nGrid price levels:")
-        for i, price in enumerate(result['grid_prices'], 1):
-            marker = "→" if abs(price - result['current_price']) < (result['grid_prices'][1] - result['grid_prices'][0]) else " "
-            print(f"  {marker} Level {i}: {price:.2f}")
+        # Mark the levels within one grid step of the market price
+        prices = np.asarray(result['grid_prices'])
+        markers = np.abs(prices - result['current_price']) < (prices[1] - prices[0])
+        
+        levels = '\n'.join(
+            f"  {'→' if is_near else ' '} Level {i}: {price:.2f}"
+            for i, (is_near, price) in enumerate(zip(markers, prices), 1)
+        )
+        print(f"\nGrid price levels:\n{levels}")
         
     except ValidationError as e:
         print(f"\n✗ Validation Error: {e}")
@@ -5,10 +5,10 @@ Places two orders where execution of one cancels the other.
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 
-from binance.exceptions import BinanceAPIException
-from client import get_binance_client
 from validators import (
     validate_symbol, validate_side, validate_quantity, 
     validate_price, ValidationError
@@ -22,7 +22,8 @@ def place_oco_order(symbol, side, quantity, price, stop_price, stop_limit_price)
     Place an OCO order on Binance Futures Testnet.
     
     Note: OCO orders on Futures work differently than spot.
-    This implementation creates a limit order and a stop-limit order manually.
+    This implementation creates a take-profit and a stop-limit order in a single
+    batch request. If only one of them is accepted it is cancelled again.
     
     Args:
         symbol (str): Trading symbol (e.g., BTCUSDT)
@@ -50,38 +51,57 @@ def place_oco_order(symbol, side, quantity, price, stop_price, stop_limit_price)
     logger.info(f"Placing OCO order: {side} {quantity} {symbol}")
     logger.info(f"  Take Profit: {price}, Stop Loss: {stop_price}/{stop_limit_price}")
     
+    # Imported here to keep CLI start-up fast
+    import orjson
+    from binance.exceptions import BinanceAPIException
+    from client import get_binance_client
+    
     try:
         client = get_binance_client()
         
         # Determine opposite side for closing position
         close_side = 'SELL' if side == 'BUY' else 'BUY'
         
-        # Place take profit limit order
-        take_profit = client.futures_create_order(
-            symbol=symbol,
-            side=close_side,
-            type='TAKE_PROFIT',
-            timeInForce='GTC',
-            quantity=quantity,
-            price=price,
-            stopPrice=price,
-            reduceOnly='true'
-        )
+        # Take profit and stop loss legs, sent together in one batchOrders request
+        orders = [
+            {
+                'symbol': symbol,
+                'side': close_side,
+                'type': 'TAKE_PROFIT',
+                'timeInForce': 'GTC',
+                'quantity': str(quantity),
+                'price': str(price),
+                'stopPrice': str(price),
+                'reduceOnly': 'true'
+            },
+            {
+                'symbol': symbol,
+                'side': close_side,
+                'type': 'STOP',
+                'timeInForce': 'GTC',
+                'quantity': str(quantity),
+                'price': str(stop_limit_price),
+                'stopPrice': str(stop_price),
+                'reduceOnly': 'true'
+            }
+        ]
+        
+        take_profit, stop_loss = client.futures_place_batch_order(batchOrders=orjson.dumps(orders).decode(), order_count=len(orders))
+        batch_response = client.response
+        
+        # Binance reports per-order failures inline; never leave a single leg open
+        errors = [order for order in (take_profit, stop_loss) if 'code' in order]
+        if errors:
+            for order in (take_profit, stop_loss):
+                if 'code' not in order:
+                    try:
+                        client.futures_cancel_order(symbol=symbol, orderId=order['orderId'])
+                        logger.info(f"Cancelled unpaired OCO order: {order.get('orderId')}")
+                    except Exception as cancel_error:
+                        logger.error(f"Could not cancel unpaired OCO order {order.get('orderId')}; it is still open: {cancel_error}")
+            raise BinanceAPIException(batch_response, batch_response.status_code, orjson.dumps(errors[0]).decode())
         
         logger.info(f"Take profit order placed: {take_profit.get('orderId')}")
-        
-        # Place stop loss order
-        stop_loss = client.futures_create_order(
-            symbol=symbol,
-            side=close_side,
-            type='STOP',
-            timeInForce='GTC',
-            quantity=quantity,
-            price=stop_limit_price,
-            stopPrice=stop_price,
-            reduceOnly='true'
-        )
-        
         logger.info(f"Stop loss order placed: {stop_loss.get('orderId')}")
         
         result = {
@@ -140,6 +160,8 @@ def main():
         print("  - Stop loss order triggered at STOP_PRICE, executed at STOP_LIMIT_PRICE")
         sys.exit(1)
     
+    from binance.exceptions import BinanceAPIException
+    
     symbol = sys.argv[1]
     side = sys.argv[2]
     quantity = sys.argv[3]
@@ -5,10 +5,10 @@ Places orders that trigger at a stop price and execute at limit price.
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 
-from binance.exceptions import BinanceAPIException
-from client import get_binance_client
 from validators import (
     validate_symbol, validate_side, validate_quantity, 
     validate_price, validate_stop_limit_prices, ValidationError
@@ -17,7 +17,7 @@ from logger import setup_logger, log_order
 
 logger = setup_logger('StopLimitOrders')
 
-def place_stop_limit_order(symbol, side, quantity, stop_price, limit_price):
+def place_stop_limit_order(symbol, side, quantity, stop_price, limit_price, use_ws=None):
     """
     Place a stop-limit order on Binance Futures Testnet.
     
@@ -27,6 +27,7 @@ def place_stop_limit_order(symbol, side, quantity, stop_price, limit_price):
         quantity (float): Order quantity
         stop_price (float): Stop trigger price
         limit_price (float): Limit order price
+        use_ws (bool, optional): Send via the WebSocket trading API; defaults to USE_WS_TRADE_API
         
     Returns:
         dict: API response with order details
@@ -47,12 +48,19 @@ def place_stop_limit_order(symbol, side, quantity, stop_price, limit_price):
     
     logger.info(f"Placing stop-limit order: {side} {quantity} {symbol} @ stop={stop_price}, limit={limit_price}")
     
+    # Imported here to keep CLI start-up fast
+    from binance.exceptions import BinanceAPIException
+    from client import get_binance_client
+    from ws_client import create_order
+    
     try:
         # Get authenticated client
         client = get_binance_client()
         
         # Place stop-limit order
-        order = client.futures_create_order(
+        order = create_order(
+            client,
+            use_ws=use_ws,
             symbol=symbol,
             side=side,
             type='STOP',
@@ -114,6 +122,8 @@ def main():
         print("  - For SELL: stop_price should be <= limit_price")
         sys.exit(1)
     
+    from binance.exceptions import BinanceAPIException
+    
     symbol = sys.argv[1]
     side = sys.argv[2]
     quantity = sys.argv[3]
@@ -6,10 +6,11 @@ Splits a large order into smaller chunks executed at regular intervals.
 import sys
 import os
 import time
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import functools
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 
-from binance.exceptions import BinanceAPIException
-from client import get_binance_client
 from validators import (
     validate_symbol, validate_side, validate_quantity, 
     validate_positive_integer, ValidationError
@@ -18,16 +19,22 @@ from logger import setup_logger, log_order
 
 logger = setup_logger('TWAP')
 
-def execute_twap(symbol, side, total_quantity, num_orders, interval_seconds):
+def execute_twap(symbol, side, total_quantity, num_orders, interval_seconds, use_ws=None):
     """
     Execute a TWAP strategy by splitting orders over time.
     
+    Orders are scheduled against fixed deadlines, so each order's round-trip
+    overlaps with the interval instead of extending it. If the interval is
+    shorter than the client's last measured ping round-trip, a single order
+    is placed instead.
+    
     Args:
         symbol (str): Trading symbol (e.g., BTCUSDT)
         side (str): Order side (BUY or SELL)
         total_quantity (float): Total quantity to trade
         num_orders (int): Number of orders to split into
         interval_seconds (int): Seconds between each order
+        use_ws (bool, optional): Send via the WebSocket trading API; defaults to USE_WS_TRADE_API
         
     Returns:
         list: List of all executed orders
@@ -52,35 +59,60 @@ def execute_twap(symbol, side, total_quantity, num_orders, interval_seconds):
     
     executed_orders = []
     
+    # Imported here to keep CLI start-up fast
+    from binance.exceptions import BinanceAPIException
+    from client import get_binance_client, OrderTemplate
+    from ws_client import create_order
+    
     try:
         client = get_binance_client()
         
+        # Slices spaced closer than one API round-trip gain no time dispersion,
+        # so collapse them into a single order for the full quantity
+        rtt = getattr(client, 'ping_rtt', 0.0)
+        if num_orders > 1 and interval_seconds < rtt:
+            logger.warning(f"Interval {interval_seconds}s is shorter than API round-trip {rtt:.2f}s; placing a single order")
+            print(f"  Interval shorter than API round-trip ({rtt:.2f}s) - placing a single order")
+            num_orders = 1
+            quantity_per_order = total_quantity
+        
+        # Every slice is the same order, so encode its parameters once
+        template = OrderTemplate(
+            client,
+            symbol=symbol,
+            side=side,
+            type='MARKET',
+            quantity=quantity_per_order
+        )
+        place_slice = functools.partial(create_order, client, use_ws=use_ws, template=template)
+        
+        # Schedule order i at start + i * interval so API latency doesn't accumulate
+        start = time.monotonic()
+        
         for i in range(num_orders):
+            delay = start + i * interval_seconds - time.monotonic()
+            if delay > 0:
+                logger.info(f"Waiting {delay:.1f} seconds before next order...")
+                print(f"  Waiting {delay:.1f} seconds...")
+                time.sleep(delay)
+            
             try:
                 # Place market order for this chunk
-                order = client.futures_create_order(
-                    symbol=symbol,
-                    side=side,
-                    type='MARKET',
-                    quantity=quantity_per_order
-                )
+                order = place_slice()
                 
                 executed_orders.append(order)
                 
                 logger.info(f"TWAP order {i+1}/{num_orders} executed: {order.get('orderId')}")
                 print(f"✓ Order {i+1}/{num_orders} executed - ID: {order.get('orderId')}")
                 
-                # Wait before next order (except for the last one)
-                if i < num_orders - 1:
-                    logger.info(f"Waiting {interval_seconds} seconds before next order...")
-                    print(f"  Waiting {interval_seconds} seconds...")
-                    time.sleep(interval_seconds)
-                    
             except BinanceAPIException as e:
                 logger.error(f"Error on TWAP order {i+1}/{num_orders}: {e}", exc_info=True)
                 print(f"✗ Error on order {i+1}/{num_orders}: {e}")
                 # Continue with remaining orders
                 
+        print(f"\n✓ TWAP execution completed!")
+        print(f"Successfully executed: {len(executed_orders)}/{num_orders} orders")
+        
         # Log overall TWAP execution
         log_order(
             logger=logger,
@@ -115,6 +147,9 @@ def main():
         print("  - Execute one order every 30 seconds")
         sys.exit(1)
     
+    import numpy as np
+    from binance.exceptions import BinanceAPIException
+    
     symbol = sys.argv[1]
     side = sys.argv[2]
     total_quantity = sys.argv[3]
@@ -129,21 +164,14 @@ def main():
         
         orders = execute_twap(symbol, side, total_quantity, num_orders, interval_seconds)
         
-        print(f"\n✓ TWAP execution completed!")
-        print(f"Successfully executed: {len(orders)}/{num_orders} orders")
-        
-        # Calculate average price if available
-        total_qty = 0
-        total_cost = 0
-        for order in orders:
-            if 'avgPrice' in order and order['avgPrice']:
-                qty = float(order.get('executedQty', 0))
-                price = float(order['avgPrice'])
-                total_qty += qty
-                total_cost += qty * price
+        # Calculate volume-weighted average price if available
+        filled = [order for order in orders if order.get('avgPrice')]
+        qtys = np.fromiter((float(order.get('executedQty', 0)) for order in filled), dtype=np.float64, count=len(filled))
+        prices = np.fromiter((float(order['avgPrice']) for order in filled), dtype=np.float64, count=len(filled))
         
+        total_qty = qtys.sum()
         if total_qty > 0:
-            avg_price = total_cost / total_qty
+            avg_price = np.dot(qtys, prices) / total_qty
             print(f"Average execution price: {avg_price:.2f}")
         
     except ValidationError as e:
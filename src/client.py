@@ -1,22 +1,56 @@
 """
 Binance Futures Testnet client configuration.
-Handles API authentication and connection setup.
+Handles API authentication and connection setup. One client, and with it one
+pooled requests.Session, is shared by every order module in the process.
 """
 
 import os
+import time
+import hmac
+import hashlib
+import threading
+from urllib.parse import urlencode
+import orjson
+from requests.adapters import HTTPAdapter
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 from dotenv import load_dotenv
 from logger import setup_logger
+from rate_limit import order_bucket
 
 # Load environment variables
 load_dotenv()
 
 logger = setup_logger('BinanceClient')
 
-def get_binance_client():
+# Seconds between keep-alive pings on the cached client's connection
+KEEPALIVE_INTERVAL = 30
+
+_CLIENT = None
+_client_lock = threading.Lock()
+
+def _orjson_response(response, *args, **kwargs):
+    """Response hook that parses JSON bodies with orjson instead of the stdlib."""
+    response.json = lambda **_: orjson.loads(response.content)
+
+def _timed_ping(client):
+    """Ping the futures API and record the round-trip time on client.ping_rtt."""
+    start = time.monotonic()
+    client.futures_ping()
+    client.ping_rtt = time.monotonic() - start
+
+def _keep_alive(client):
+    """Ping the futures API periodically so the pooled connection stays open."""
+    while True:
+        time.sleep(KEEPALIVE_INTERVAL)
+        try:
+            _timed_ping(client)
+        except Exception as e:
+            logger.debug(f"Keep-alive ping failed: {e}")
+
+def _create_client():
     """
-    Initialize and return Binance Futures Testnet client.
+    Create, configure and ping a new Binance Futures Testnet client.
     
     Returns:
         Client: Authenticated Binance client instance
@@ -37,8 +71,16 @@ def get_binance_client():
         # Initialize client with testnet enabled
         client = Client(api_key, api_secret, testnet=True)
         
-        # Test connection
-        client.futures_ping()
+        # Enlarge the connection pool so concurrent requests reuse connections
+        client.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+        client.session.headers['Connection'] = 'keep-alive'
+        client.session.hooks['response'].append(_orjson_response)
+        
+        # Test connection and take a first latency sample
+        _timed_ping(client)
+        
+        # Keep the connection warm between orders
+        threading.Thread(target=_keep_alive, args=(client,), daemon=True).start()
         
         logger.info("Successfully connected to Binance Futures Testnet")
         return client
@@ -50,6 +92,100 @@ def get_binance_client():
         logger.error(f"Error initializing Binance client: {e}", exc_info=True)
         raise
 
+class RateLimitedClient:
+    """
+    Binance client wrapper that paces order placement through the shared token bucket.
+    
+    All other attributes and methods are delegated to the wrapped client.
+    """
+    
+    def __init__(self, client):
+        self._client = client
+    
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+    
+    def futures_create_order(self, **params):
+        order_bucket.acquire()
+        return self._client.futures_create_order(**params)
+    
+    def futures_place_batch_order(self, order_count=None, **params):
+        # Each order in a batch counts against the order rate limit; callers that
+        # pass batchOrders as a JSON string should give order_count to avoid a re-parse
+        if order_count is None:
+            batch = params['batchOrders']
+            order_count = len(batch) if isinstance(batch, list) else len(orjson.loads(batch))
+        order_bucket.acquire(order_count)
+        return self._client.futures_place_batch_order(**params)
+
+def get_binance_client():
+    """
+    Return the Binance Futures Testnet client, creating it on first use.
+    
+    The client is created and pinged once per process; later calls (from any
+    thread) reuse it and its warm HTTP connection without another round-trip.
+    
+    Returns:
+        RateLimitedClient: Authenticated, rate-limited Binance client
+        
+    Raises:
+        Exception: If API credentials are missing or invalid
+    """
+    global _CLIENT
+    
+    if _CLIENT is None:
+        with _client_lock:
+            if _CLIENT is None:
+                _CLIENT = RateLimitedClient(_create_client())
+    
+    return _CLIENT
+
+class OrderTemplate:
+    """
+    Pre-encoded order request for orders that share most of their parameters.
+    
+    The fixed parameters are URL-encoded once; each order only appends its
+    varying fields and timestamp before signing and posting to /fapi/v1/order
+    over the client's pooled session.
+    """
+    
+    def __init__(self, client, **fixed_params):
+        self.client = client
+        self.params = fixed_params
+        self._prefix = urlencode(fixed_params)
+        self._secret = client.API_SECRET.encode('utf-8')
+        self._url = client._create_futures_api_uri('order')
+    
+    def place(self, **params):
+        """
+        Place one order from the template.
+        
+        Args:
+            **params: Order fields not fixed by the template (e.g. side, price)
+            
+        Returns:
+            dict: API response with order details
+            
+        Raises:
+            BinanceAPIException: If the order is rejected
+        """
+        order_bucket.acquire()
+        
+        body = self._prefix
+        if params:
+            body += '&' + urlencode(params)
+        body += '&timestamp=' + str(int(time.time() * 1000 + self.client.timestamp_offset))
+        
+        signature = hmac.new(self._secret, body.encode('utf-8'), hashlib.sha256).hexdigest()
+        
+        response = self.client.session.post(
+            self._url,
+            data=body + '&signature=' + signature,
+            headers={'Content-Type': 'application/x-www-form-urlencoded'},
+            timeout=self.client.REQUEST_TIMEOUT
+        )
+        return self.client._handle_response(response)
+
 def test_connection():
     """
     Test the connection to Binance Futures Testnet.
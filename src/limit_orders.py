@@ -4,14 +4,12 @@ Supports BUY and SELL limit orders with price specification.
 """
 
 import sys
-from binance.exceptions import BinanceAPIException
-from client import get_binance_client
 from validators import validate_symbol, validate_side, validate_quantity, validate_price, ValidationError
 from logger import setup_logger, log_order
 
 logger = setup_logger('LimitOrders')
 
-def place_limit_order(symbol, side, quantity, price):
+def place_limit_order(symbol, side, quantity, price, use_ws=None):
     """
     Place a limit order on Binance Futures Testnet.
     
@@ -20,6 +18,7 @@ def place_limit_order(symbol, side, quantity, price):
         side (str): Order side (BUY or SELL)
         quantity (float): Order quantity
         price (float): Limit price
+        use_ws (bool, optional): Send via the WebSocket trading API; defaults to USE_WS_TRADE_API
         
     Returns:
         dict: API response with order details
@@ -36,12 +35,19 @@ def place_limit_order(symbol, side, quantity, price):
     
     logger.info(f"Placing limit order: {side} {quantity} {symbol} @ {price}")
     
+    # Imported here to keep CLI start-up fast
+    from binance.exceptions import BinanceAPIException
+    from client import get_binance_client
+    from ws_client import create_order
+    
     try:
         # Get authenticated client
         client = get_binance_client()
         
         # Place limit order
-        order = client.futures_create_order(
+        order = create_order(
+            client,
+            use_ws=use_ws,
             symbol=symbol,
             side=side,
             type='LIMIT',
@@ -96,6 +102,8 @@ def main():
         print("Example: python limit_orders.py BTCUSDT SELL 0.01 45000")
         sys.exit(1)
     
+    from binance.exceptions import BinanceAPIException
+    
     symbol = sys.argv[1]
     side = sys.argv[2]
     quantity = sys.argv[3]
@@ -3,14 +3,126 @@ Structured logging configuration for the trading bot.
 Logs are written to bot.log with timestamp, level, and detailed information.
 """
 
+import io
+import os
+import time
+import atexit
+import functools
 import logging
+import queue
 import sys
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+# Maximum number of records waiting for the background listener
+LOG_QUEUE_SIZE = 10000
+
+# bot.log write buffer size in bytes, and how often buffered records are flushed
+LOG_BUFFER_SIZE = int(os.getenv('BOT_LOG_BUFFER_SIZE', 65536))
+LOG_FLUSH_INTERVAL = 0.5
+
+# File records are queued by the calling thread and written by a background listener
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_listener = None
+_console_handler = None
+_listener_lock = threading.Lock()
+
+class _BlockingQueueHandler(QueueHandler):
+    """QueueHandler that waits for space when the queue is full instead of failing."""
+    
+    def enqueue(self, record):
+        self.queue.put(record)
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that batches writes in a large buffer instead of flushing every record.
+    
+    The buffer is flushed for ERROR and above, by flush_buffer(), and when the
+    handler is closed.
+    """
+    
+    def __init__(self, filename, mode='a', encoding=None, buffer_size=LOG_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode=mode, encoding=encoding)
+    
+    def _open(self):
+        raw = open(self.baseFilename, self.mode + 'b', buffering=self.buffer_size)
+        return io.TextIOWrapper(raw, encoding=self.encoding, errors=self.errors, write_through=False)
+    
+    def flush(self):
+        # Called by StreamHandler.emit after every record; defer to flush_buffer()
+        pass
+    
+    def flush_buffer(self):
+        """Write buffered records to disk."""
+        with self.lock:
+            if self.stream and hasattr(self.stream, 'flush'):
+                self.stream.flush()
+    
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.flush_buffer()
+
+class CachedFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records within the same second."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = None
+        self._last_asctime = ''
+    
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_asctime = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_asctime
+
+def _flush_periodically(handler):
+    """Flush a BufferedFileHandler every LOG_FLUSH_INTERVAL seconds."""
+    while True:
+        time.sleep(LOG_FLUSH_INTERVAL)
+        handler.flush_buffer()
+
+def _make_formatter():
+    """Return the shared log line format; each handler gets its own instance."""
+    return CachedFormatter(
+        '{asctime} | {levelname:<8} | {message}',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        style='{'
+    )
+
+def _start_listener():
+    """Create the shared file and console handlers and start the queue listener."""
+    global _listener, _console_handler
+    
+    # File handler, written from the listener thread
+    file_handler = BufferedFileHandler('bot.log', mode='a')
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(_make_formatter())
+    
+    # Console handler, written synchronously so log lines stay ordered with CLI print() output
+    _console_handler = logging.StreamHandler(sys.stdout)
+    _console_handler.setLevel(logging.INFO)
+    _console_handler.setFormatter(_make_formatter())
+    
+    _listener = QueueListener(_log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    
+    threading.Thread(target=_flush_periodically, args=(file_handler,), daemon=True).start()
+    
+    # Drain queued records before the process exits
+    atexit.register(_listener.stop)
 
 def setup_logger(name='TradingBot'):
     """
     Configure and return a logger instance with file and console handlers.
     
+    Console output is written by the calling thread; file records are only
+    enqueued and are formatted and written on a shared background listener thread.
+    
     Args:
         name (str): Logger name
         
@@ -24,32 +136,27 @@ def setup_logger(name='TradingBot'):
     if logger.handlers:
         return logger
     
-    # File handler
-    file_handler = logging.FileHandler('bot.log', mode='a')
-    file_handler.setLevel(logging.DEBUG)
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    with _listener_lock:
+        if _listener is None:
+            _start_listener()
     
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(_BlockingQueueHandler(_log_queue))
+    logger.addHandler(_console_handler)
     
     return logger
 
+@functools.lru_cache(maxsize=128)
+def _order_prefix(order_type, symbol, side):
+    """Return the shared start of an order log line, built once per combination."""
+    return f"Order Type: {order_type} | Symbol: {symbol} | Side: {side}"
+
 def log_order(logger, order_type, symbol, side, quantity, price=None, stop_price=None, response=None, error=None):
     """
     Log order details in a structured format.
     
+    This is the single source of truth for order lifecycle entries; callers
+    should not emit their own INFO line for the same order.
+    
     Args:
         logger: Logger instance
         order_type (str): Type of order (MARKET, LIMIT, STOP_LIMIT, etc.)
@@ -61,18 +168,53 @@ def log_order(logger, order_type, symbol, side, quantity, price=None, stop_price
         response (dict, optional): API response
         error (Exception, optional): Error if any
     """
-    log_msg = f"Order Type: {order_type} | Symbol: {symbol} | Side: {side} | Quantity: {quantity}"
-    
-    if price:
-        log_msg += f" | Price: {price}"
-    if stop_price:
-        log_msg += f" | Stop Price: {stop_price}"
+    log_msg = (
+        f"{_order_prefix(order_type, symbol, side)} | Quantity: {quantity}"
+        f"{f' | Price: {price}' if price else ''}"
+        f"{f' | Stop Price: {stop_price}' if stop_price else ''}"
+    )
     
     if error:
-        logger.error(f"{log_msg} | Status: FAILED | Error: {str(error)}", exc_info=True)
+        logger.error(f"{log_msg} | Status: FAILED | Error: {str(error)}")
     elif response:
         order_id = response.get('orderId', 'N/A')
         status = response.get('status', 'N/A')
         logger.info(f"{log_msg} | Status: {status} | Order ID: {order_id}")
     else:
         logger.info(log_msg)
+
+_fast_fd = None
+_fast_fd_lock = threading.Lock()
+
+def log_order_fast(order_type, symbol, side, quantity, order_id):
+    """
+    Append a successful-order line to bot.log with a single os.write call.
+    
+    Bypasses the logging machinery entirely (no LogRecord, handler lock or
+    queue), so use it only on the successful-order path where latency matters.
+    Lines are written immediately and may appear ahead of buffered records
+    from the standard loggers.
+    
+    Args:
+        order_type (str): Type of order (MARKET, LIMIT, etc.)
+        symbol (str): Trading symbol
+        side (str): BUY or SELL
+        quantity (float): Order quantity
+        order_id: Order ID returned by the API
+    """
+    global _fast_fd
+    
+    if _fast_fd is None:
+        with _fast_fd_lock:
+            if _fast_fd is None:
+                _fast_fd = os.open('bot.log', os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    
+    line = b'%b | INFO     | Order Type: %b | Symbol: %b | Side: %b | Quantity: %b | Order ID: %b\n' % (
+        time.strftime('%Y-%m-%d %H:%M:%S').encode(),
+        order_type.encode(),
+        symbol.encode(),
+        side.encode(),
+        str(quantity).encode(),
+        str(order_id).encode()
+    )
+    os.write(_fast_fd, line)
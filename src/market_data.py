@@ -0,0 +1,148 @@
+"""
+Live market data for Binance Futures Testnet.
+Keeps the latest best bid/ask per symbol in memory from the bookTicker stream.
+"""
+
+import time
+import atexit
+import threading
+from binance import ThreadedWebsocketManager
+from logger import setup_logger
+
+logger = setup_logger('MarketData')
+
+# Quotes older than this many seconds are not used
+MAX_QUOTE_AGE = 2.0
+
+# Seconds get_mid_price waits for a new subscription's first quote before using REST
+FIRST_QUOTE_TIMEOUT = 0.5
+
+# Latest quote per symbol: (bid, ask, time.monotonic() when received)
+latest = {}
+
+_manager = None
+_subscribed = set()
+_first_quote = {}
+_lock = threading.Lock()
+
+class _QuoteStreamManager(ThreadedWebsocketManager):
+    """Websocket manager that logs stream failures instead of printing raw tracebacks."""
+    
+    def _handle_loop_exception(self, loop, context):
+        logger.warning(f"bookTicker stream error: {context.get('exception') or context.get('message')}")
+        
+    def run(self):
+        self._loop.set_exception_handler(self._handle_loop_exception)
+        try:
+            super().run()
+        except Exception as e:
+            logger.warning(f"bookTicker stream stopped: {e}")
+
+def _handle_book_ticker(msg):
+    """Store the best bid/ask from a bookTicker stream message."""
+    data = msg.get('data', msg)
+    if 's' in data:
+        latest[data['s']] = (float(data['b']), float(data['a']), time.monotonic())
+        
+        event = _first_quote.get(data['s'])
+        if event is not None:
+            event.set()
+
+def _start_stream(symbol):
+    """Start the websocket manager if needed and open the symbol's bookTicker stream."""
+    global _manager
+    
+    try:
+        with _lock:
+            if _manager is None:
+                _manager = _QuoteStreamManager(testnet=True)
+                _manager.daemon = True
+                _manager.start()
+            manager = _manager
+                
+        manager.start_futures_multiplex_socket(
+            callback=_handle_book_ticker,
+            streams=[f"{symbol.lower()}@bookTicker"]
+        )
+        logger.info(f"Subscribed to {symbol} bookTicker stream")
+        
+    except Exception as e:
+        logger.error(f"Error subscribing to {symbol} bookTicker stream: {e}")
+        with _lock:
+            _subscribed.discard(symbol)
+
+def subscribe(symbol):
+    """
+    Start streaming best bid/ask for a symbol in the background.
+    
+    Args:
+        symbol (str): Trading symbol (e.g., BTCUSDT)
+    """
+    with _lock:
+        if symbol in _subscribed:
+            return
+        _subscribed.add(symbol)
+        _first_quote[symbol] = threading.Event()
+        
+    threading.Thread(target=_start_stream, args=(symbol,), daemon=True).start()
+
+def get(symbol, max_age=MAX_QUOTE_AGE):
+    """
+    Get the latest streamed best bid/ask for a symbol.
+    
+    Args:
+        symbol (str): Trading symbol
+        max_age (float): Maximum quote age in seconds
+        
+    Returns:
+        tuple: (bid, ask), or None if no quote is fresh enough
+    """
+    quote = latest.get(symbol)
+    if quote is None or time.monotonic() - quote[2] > max_age:
+        return None
+    return quote[0], quote[1]
+
+def stop():
+    """Stop the websocket manager and forget all subscriptions."""
+    global _manager
+    
+    with _lock:
+        manager, _manager = _manager, None
+        _subscribed.clear()
+        _first_quote.clear()
+        
+    if manager is not None:
+        manager.stop()
+
+atexit.register(stop)
+
+def get_mid_price(client, symbol, max_age=MAX_QUOTE_AGE, wait=FIRST_QUOTE_TIMEOUT):
+    """
+    Get the current mid price, from the stream when fresh and REST otherwise.
+    
+    Subscribe to the symbol ahead of time so the first quote can arrive while
+    other setup work runs.
+    
+    Args:
+        client: Authenticated Binance client used for the REST fallback
+        symbol (str): Trading symbol
+        max_age (float): Maximum quote age in seconds
+        wait (float): Seconds to wait for the subscription's first quote
+        
+    Returns:
+        float: Current market price
+    """
+    subscribe(symbol)
+    
+    quote = get(symbol, max_age)
+    if quote is None and wait > 0:
+        event = _first_quote.get(symbol)
+        if event is not None and not event.is_set() and event.wait(wait):
+            quote = get(symbol, max_age)
+            
+    if quote is not None:
+        bid, ask = quote
+        return (bid + ask) / 2
+        
+    ticker = client.futures_symbol_ticker(symbol=symbol)
+    return float(ticker['price'])
@@ -11,6 +11,9 @@ from logger import setup_logger, log_order
 
 logger = setup_logger('MarketOrders')
 
+# Fixed market order parameters, copied and completed per order
+_MKT_TEMPLATE = {'type': 'MARKET'}
+
 def place_market_order(symbol, side, quantity):
     """
     Place a market order on Binance Futures Testnet.
@@ -32,19 +35,18 @@ def place_market_order(symbol, side, quantity):
     side = validate_side(side)
     quantity = validate_quantity(quantity)
     
-    logger.info(f"Placing market order: {side} {quantity} {symbol}")
+    logger.debug("Placing market order: %s %s %s", side, quantity, symbol)
     
     try:
         # Get authenticated client
         client = get_binance_client()
         
         # Place market order
-        order = client.futures_create_order(
-            symbol=symbol,
-            side=side,
-            type='MARKET',
-            quantity=quantity
-        )
+        params = _MKT_TEMPLATE.copy()
+        params['symbol'] = symbol
+        params['side'] = side
+        params['quantity'] = quantity
+        order = client.futures_create_order(**params)
         
         # Log successful order
         log_order(
@@ -59,7 +61,7 @@ def place_market_order(symbol, side, quantity):
         return order
         
     except BinanceAPIException as e:
-        logger.error(f"Binance API error: {e}", exc_info=True)
+        logger.error("Binance API error: %s", e)
         log_order(
             logger=logger,
             order_type='MARKET',
@@ -71,7 +73,7 @@ def place_market_order(symbol, side, quantity):
         raise
         
     except Exception as e:
-        logger.error(f"Unexpected error placing market order: {e}", exc_info=True)
+        logger.error("Unexpected error placing market order: %s", e)
         log_order(
             logger=logger,
             order_type='MARKET',
@@ -116,6 +118,7 @@ def main():
         sys.exit(1)
         
     except Exception as e:
+        logger.exception(e)
         print(f"\n✗ Error: {e}")
         sys.exit(1)
 
@@ -4,6 +4,9 @@ Provides helper functions to manage active orders.
 """
 
 import sys
+import operator
+import functools
+import orjson
 from binance.exceptions import BinanceAPIException
 from client import get_binance_client
 from validators import validate_symbol, ValidationError
@@ -11,6 +14,49 @@ from logger import setup_logger
 
 logger = setup_logger('OrderManager')
 
+# The log format never shows caller details, so skip the stack-frame lookup
+logger.findCaller = lambda *args, **kwargs: ("(unknown file)", 0, "(unknown function)", None)
+
+# Maximum number of order IDs accepted by a single batch cancel request
+CANCEL_BATCH_SIZE = 10
+
+# Order fields shown by display_orders, with defaults for responses missing any of them
+_FIELD_NAMES = ('orderId', 'symbol', 'side', 'type', 'origQty', 'price', 'status')
+_FIELD_DEFAULTS = ('N/A', 'N/A', 'N/A', 'N/A', 'N/A', 'MARKET', 'N/A')
+_FIELDS = operator.itemgetter(*_FIELD_NAMES)
+
+def _order_fields(order):
+    """Return the display_orders fields of an order, filling in defaults if any are missing."""
+    try:
+        return _FIELDS(order)
+    except KeyError:
+        return tuple(order.get(name, default) for name, default in zip(_FIELD_NAMES, _FIELD_DEFAULTS))
+
+def _trap_and_log(action):
+    """
+    Decorator that logs and re-raises errors from an order management call.
+    
+    Args:
+        action (str): Description for unexpected errors (e.g. "cancelling order")
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except ValidationError as e:
+                logger.error("Validation error: %s", e)
+                raise
+            except BinanceAPIException as e:
+                logger.error("Binance API error: %s", e)
+                raise
+            except Exception as e:
+                logger.error("Error %s: %s", action, e)
+                raise
+        return wrapper
+    return decorator
+
+@_trap_and_log('getting open orders')
 def get_open_orders(symbol=None):
     """
     Get all open orders or orders for a specific symbol.
@@ -21,29 +67,19 @@ def get_open_orders(symbol=None):
     Returns:
         list: List of open orders
     """
-    try:
-        client = get_binance_client()
-        
-        if symbol:
-            symbol = validate_symbol(symbol)
-            orders = client.futures_get_open_orders(symbol=symbol)
-            logger.info(f"Retrieved {len(orders)} open orders for {symbol}")
-        else:
-            orders = client.futures_get_open_orders()
-            logger.info(f"Retrieved {len(orders)} open orders")
-        
-        return orders
-        
-    except ValidationError as e:
-        logger.error(f"Validation error: {e}")
-        raise
-    except BinanceAPIException as e:
-        logger.error(f"Binance API error: {e}", exc_info=True)
-        raise
-    except Exception as e:
-        logger.error(f"Error getting open orders: {e}", exc_info=True)
-        raise
+    client = get_binance_client()
+    
+    if symbol:
+        symbol = validate_symbol(symbol)
+        orders = client.futures_get_open_orders(symbol=symbol)
+        logger.info("Retrieved %d open orders for %s", len(orders), symbol)
+    else:
+        orders = client.futures_get_open_orders()
+        logger.info("Retrieved %d open orders", len(orders))
+    
+    return orders
 
+@_trap_and_log('cancelling order')
 def cancel_order(symbol, order_id):
     """
     Cancel a specific order.
@@ -55,28 +91,48 @@ def cancel_order(symbol, order_id):
     Returns:
         dict: Cancellation response
     """
-    try:
-        symbol = validate_symbol(symbol)
-        client = get_binance_client()
+    symbol = validate_symbol(symbol)
+    client = get_binance_client()
+    
+    result = client.futures_cancel_order(
+        symbol=symbol,
+        orderId=order_id
+    )
+    
+    logger.info("Cancelled order %s for %s", order_id, symbol)
+    return result
+
+@_trap_and_log('cancelling orders')
+def cancel_orders(symbol, order_ids):
+    """
+    Cancel several orders with batch requests instead of one request per order.
+    
+    Args:
+        symbol (str): Trading symbol
+        order_ids (list): Order IDs to cancel
         
-        result = client.futures_cancel_order(
+    Returns:
+        list: Cancellation response per order; failed cancellations carry 'code' and 'msg'
+    """
+    symbol = validate_symbol(symbol)
+    client = get_binance_client()
+    
+    results = []
+    for start in range(0, len(order_ids), CANCEL_BATCH_SIZE):
+        batch = order_ids[start:start + CANCEL_BATCH_SIZE]
+        results.extend(client.futures_cancel_orders(
             symbol=symbol,
-            orderId=order_id
-        )
-        
-        logger.info(f"Cancelled order {order_id} for {symbol}")
-        return result
-        
-    except ValidationError as e:
-        logger.error(f"Validation error: {e}")
-        raise
-    except BinanceAPIException as e:
-        logger.error(f"Binance API error: {e}", exc_info=True)
-        raise
-    except Exception as e:
-        logger.error(f"Error cancelling order: {e}", exc_info=True)
-        raise
+            orderIdList=orjson.dumps(batch).decode()
+        ))
+    
+    failed = [result for result in results if 'code' in result]
+    for result in failed:
+        logger.error("Error cancelling order for %s: %s", symbol, result.get('msg'))
+    
+    logger.info("Cancelled %d/%d orders for %s", len(results) - len(failed), len(order_ids), symbol)
+    return results
 
+@_trap_and_log('cancelling all orders')
 def cancel_all_orders(symbol):
     """
     Cancel all open orders for a symbol.
@@ -87,25 +143,15 @@ def cancel_all_orders(symbol):
     Returns:
         list: List of cancelled orders
     """
-    try:
-        symbol = validate_symbol(symbol)
-        client = get_binance_client()
-        
-        result = client.futures_cancel_all_open_orders(symbol=symbol)
-        
-        logger.info(f"Cancelled all orders for {symbol}")
-        return result
-        
-    except ValidationError as e:
-        logger.error(f"Validation error: {e}")
-        raise
-    except BinanceAPIException as e:
-        logger.error(f"Binance API error: {e}", exc_info=True)
-        raise
-    except Exception as e:
-        logger.error(f"Error cancelling all orders: {e}", exc_info=True)
-        raise
+    symbol = validate_symbol(symbol)
+    client = get_binance_client()
+    
+    result = client.futures_cancel_all_open_orders(symbol=symbol)
+    
+    logger.info("Cancelled all orders for %s", symbol)
+    return result
 
+@_trap_and_log('getting order status')
 def get_order_status(symbol, order_id):
     """
     Get the status of a specific order.
@@ -117,27 +163,16 @@ def get_order_status(symbol, order_id):
     Returns:
         dict: Order information
     """
-    try:
-        symbol = validate_symbol(symbol)
-        client = get_binance_client()
-        
-        order = client.futures_get_order(
-            symbol=symbol,
-            orderId=order_id
-        )
-        
-        logger.info(f"Retrieved status for order {order_id}")
-        return order
-        
-    except ValidationError as e:
-        logger.error(f"Validation error: {e}")
-        raise
-    except BinanceAPIException as e:
-        logger.error(f"Binance API error: {e}", exc_info=True)
-        raise
-    except Exception as e:
-        logger.error(f"Error getting order status: {e}", exc_info=True)
-        raise
+    symbol = validate_symbol(symbol)
+    client = get_binance_client()
+    
+    order = client.futures_get_order(
+        symbol=symbol,
+        orderId=order_id
+    )
+    
+    logger.info("Retrieved status for order %s", order_id)
+    return order
 
 def display_orders(orders):
     """
@@ -150,21 +185,95 @@ def display_orders(orders):
         print("No orders found.")
         return
     
-    print(f"\nTotal Orders: {len(orders)}")
-    print("-" * 100)
-    print(f"{'ID':<15} {'Symbol':<10} {'Side':<6} {'Type':<10} {'Quantity':<12} {'Price':<12} {'Status':<10}")
-    print("-" * 100)
+    row = "{:<15} {:<10} {:<6} {:<10} {:<12} {:<12} {:<10}".format
+    separator = "-" * 100
     
+    rows = []
     for order in orders:
-        order_id = str(order.get('orderId', 'N/A'))
-        symbol = order.get('symbol', 'N/A')
-        side = order.get('side', 'N/A')
-        order_type = order.get('type', 'N/A')
-        quantity = order.get('origQty', 'N/A')
-        price = order.get('price', 'MARKET')
-        status = order.get('status', 'N/A')
-        
-        print(f"{order_id:<15} {symbol:<10} {side:<6} {order_type:<10} {quantity:<12} {price:<12} {status:<10}")
+        order_id, symbol, side, order_type, quantity, price, status = _order_fields(order)
+        rows.append(row(str(order_id), symbol, side, order_type, quantity, price, status))
+    
+    # Write the whole table at once rather than one print per row
+    sys.stdout.write('\n'.join([
+        f"\nTotal Orders: {len(orders)}",
+        separator,
+        row('ID', 'Symbol', 'Side', 'Type', 'Quantity', 'Price', 'Status'),
+        separator,
+        *rows
+    ]) + '\n')
+
+def _cmd_list(args):
+    """Handle: list [SYMBOL]"""
+    symbol = args[0] if args else None
+    orders = get_open_orders(symbol)
+    display_orders(orders)
+
+def _cmd_cancel(args):
+    """Handle: cancel <SYMBOL> <ORDER_ID>[,<ORDER_ID>...]"""
+    if len(args) != 2:
+        print("Usage: python order_manager.py cancel <SYMBOL> <ORDER_ID>[,<ORDER_ID>...]")
+        sys.exit(1)
+    
+    symbol = args[0]
+    
+    if ',' in args[1]:
+        order_ids = [int(order_id) for order_id in args[1].split(',')]
+        results = cancel_orders(symbol, order_ids)
+        for order_id, result in zip(order_ids, results):
+            if 'code' in result:
+                print(f"✗ Order {order_id}: {result.get('msg')}")
+            else:
+                print(f"✓ Order {order_id} cancelled successfully")
+    else:
+        order_id = int(args[1])
+        cancel_order(symbol, order_id)
+        print(f"✓ Order {order_id} cancelled successfully")
+
+def _cmd_cancel_all(args):
+    """Handle: cancel_all <SYMBOL>"""
+    if len(args) != 1:
+        print("Usage: python order_manager.py cancel_all <SYMBOL>")
+        sys.exit(1)
+    
+    symbol = args[0]
+    cancel_all_orders(symbol)
+    print(f"✓ All orders for {symbol} cancelled successfully")
+
+def _cmd_status(args):
+    """Handle: status <SYMBOL> <ORDER_ID>"""
+    if len(args) != 2:
+        print("Usage: python order_manager.py status <SYMBOL> <ORDER_ID>")
+        sys.exit(1)
+    
+    symbol = args[0]
+    order_id = int(args[1])
+    order = get_order_status(symbol, order_id)
+    
+    print(f"\nOrder Details:")
+    print(f"  Order ID: {order.get('orderId')}")
+    print(f"  Symbol: {order.get('symbol')}")
+    print(f"  Side: {order.get('side')}")
+    print(f"  Type: {order.get('type')}")
+    print(f"  Status: {order.get('status')}")
+    print(f"  Original Qty: {order.get('origQty')}")
+    print(f"  Executed Qty: {order.get('executedQty')}")
+    print(f"  Price: {order.get('price')}")
+    if order.get('stopPrice'):
+        print(f"  Stop Price: {order.get('stopPrice')}")
+
+# CLI command name -> handler taking the remaining arguments
+_COMMANDS = {
+    "list": _cmd_list,
+    "cancel": _cmd_cancel,
+    "cancel_all": _cmd_cancel_all,
+    "status": _cmd_status,
+}
+
+# Expected CLI error types -> message label
+_EXC_MAP = {
+    ValidationError: "Validation Error",
+    BinanceAPIException: "Binance API Error",
+}
 
 def main():
     """CLI entry point for order management."""
@@ -173,79 +282,39 @@ def main():
         print("\nUsage:")
         print("  python order_manager.py list [SYMBOL]           - List open orders")
         print("  python order_manager.py cancel <SYMBOL> <ID>    - Cancel specific order")
+        print("  python order_manager.py cancel <SYMBOL> <ID,ID> - Cancel several orders in one request")
         print("  python order_manager.py cancel_all <SYMBOL>     - Cancel all orders for symbol")
         print("  python order_manager.py status <SYMBOL> <ID>    - Get order status")
         print("\nExamples:")
         print("  python order_manager.py list")
         print("  python order_manager.py list BTCUSDT")
         print("  python order_manager.py cancel BTCUSDT 12345678")
+        print("  python order_manager.py cancel BTCUSDT 12345678,12345679")
         print("  python order_manager.py cancel_all BTCUSDT")
         print("  python order_manager.py status BTCUSDT 12345678")
         sys.exit(1)
     
     command = sys.argv[1].lower()
+    handler = _COMMANDS.get(command)
     
-    try:
-        if command == "list":
-            symbol = sys.argv[2] if len(sys.argv) > 2 else None
-            orders = get_open_orders(symbol)
-            display_orders(orders)
-            
-        elif command == "cancel":
-            if len(sys.argv) != 4:
-                print("Usage: python order_manager.py cancel <SYMBOL> <ORDER_ID>")
-                sys.exit(1)
-            
-            symbol = sys.argv[2]
-            order_id = int(sys.argv[3])
-            result = cancel_order(symbol, order_id)
-            print(f"✓ Order {order_id} cancelled successfully")
-            
-        elif command == "cancel_all":
-            if len(sys.argv) != 3:
-                print("Usage: python order_manager.py cancel_all <SYMBOL>")
-                sys.exit(1)
-            
-            symbol = sys.argv[2]
-            result = cancel_all_orders(symbol)
-            print(f"✓ All orders for {symbol} cancelled successfully")
-            
-        elif command == "status":
-            if len(sys.argv) != 4:
-                print("Usage: python order_manager.py status <SYMBOL> <ORDER_ID>")
-                sys.exit(1)
-            
-            symbol = sys.argv[2]
-            order_id = int(sys.argv[3])
-            order = get_order_status(symbol, order_id)
-            
-            print(f"\nOrder Details:")
-            print(f"  Order ID: {order.get('orderId')}")
-            print(f"  Symbol: {order.get('symbol')}")
-            print(f"  Side: {order.get('side')}")
-            print(f"  Type: {order.get('type')}")
-            print(f"  Status: {order.get('status')}")
-            print(f"  Original Qty: {order.get('origQty')}")
-            print(f"  Executed Qty: {order.get('executedQty')}")
-            print(f"  Price: {order.get('price')}")
-            if order.get('stopPrice'):
-                print(f"  Stop Price: {order.get('stopPrice')}")
-            
-        else:
-            print(f"Unknown command: {command}")
-            sys.exit(1)
-            
-    except ValidationError as e:
-        print(f"✗ Validation Error: {e}")
-        sys.exit(1)
-    except BinanceAPIException as e:
-        print(f"✗ Binance API Error: {e}")
-        sys.exit(1)
-    except ValueError:
-        print(f"✗ Invalid order ID. Must be a number.")
+    if handler is None:
+        print(f"Unknown command: {command}")
         sys.exit(1)
+    
+    try:
+        handler(sys.argv[2:])
+        
     except Exception as e:
-        print(f"✗ Error: {e}")
+        for exc_type, label in _EXC_MAP.items():
+            if isinstance(e, exc_type):
+                print(f"✗ {label}: {e}")
+                break
+        else:
+            if isinstance(e, ValueError):
+                print(f"✗ Invalid order ID. Must be a number.")
+            else:
+                logger.exception(e)
+                print(f"✗ Error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+"""
+Order rate limiting for Binance Futures.
+Shares one token bucket between every order-placement path so bursts stay under the exchange limit.
+"""
+
+import time
+import threading
+
+# Binance Futures allows roughly 10 orders per second per account
+ORDERS_PER_SECOND = 10
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `rate` tokens per second."""
+    
+    def __init__(self, rate=ORDERS_PER_SECOND, capacity=ORDERS_PER_SECOND):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def acquire(self, tokens=1):
+        """
+        Block until enough tokens are available, then consume them.
+        
+        Args:
+            tokens (int): Number of tokens to consume (capped at capacity)
+        """
+        tokens = min(tokens, self.capacity)
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                    
+                wait = (tokens - self._tokens) / self.rate
+                
+            time.sleep(wait)
+            
+    def release(self, tokens=1):
+        """
+        Return tokens that were acquired for a request that was never sent.
+        
+        Args:
+            tokens (int): Number of tokens to return
+        """
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+# Shared by all order-placement code in the process
+order_bucket = TokenBucket()
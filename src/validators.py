@@ -3,7 +3,13 @@ Input validation utilities for trading bot.
 Validates symbols, order sides, quantities, and prices.
 """
 
-import re
+import functools
+
+# Errors raised by float()/int() for unparseable input
+_NUMERIC_ERRORS = (ValueError, TypeError)
+
+# Accepted order sides
+_VALID_SIDES = frozenset(('BUY', 'SELL'))
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
@@ -25,10 +31,15 @@ def validate_symbol(symbol):
     if not symbol or not isinstance(symbol, str):
         raise ValidationError("Symbol must be a non-empty string")
     
+    return _validate_symbol_str(symbol)
+
+@functools.lru_cache(maxsize=256)
+def _validate_symbol_str(symbol):
+    """Check a non-empty symbol string; cached since the same symbols repeat."""
     symbol = symbol.upper()
     
-    # Check if symbol matches expected pattern (letters/numbers only)
-    if not re.match(r'^[A-Z0-9]+$', symbol):
+    # Check if symbol matches expected pattern (ASCII letters/numbers only)
+    if not (symbol.isascii() and symbol.isalnum()):
         raise ValidationError(f"Invalid symbol format: {symbol}")
     
     # Common symbols should end with USDT for futures
@@ -53,9 +64,14 @@ def validate_side(side):
     if not side or not isinstance(side, str):
         raise ValidationError("Side must be a non-empty string")
     
+    return _validate_side_str(side)
+
+@functools.lru_cache(maxsize=256)
+def _validate_side_str(side):
+    """Check a non-empty side string; cached since the same sides repeat."""
     side = side.upper()
     
-    if side not in ['BUY', 'SELL']:
+    if side not in _VALID_SIDES:
         raise ValidationError(f"Side must be BUY or SELL, got: {side}")
     
     return side
@@ -73,10 +89,13 @@ def validate_quantity(quantity):
     Raises:
         ValidationError: If quantity is invalid or non-positive
     """
-    try:
+    if isinstance(quantity, (int, float)):
         qty = float(quantity)
-    except (ValueError, TypeError):
-        raise ValidationError(f"Quantity must be a number, got: {quantity}")
+    else:
+        try:
+            qty = float(quantity)
+        except _NUMERIC_ERRORS:
+            raise ValidationError(f"Quantity must be a number, got: {quantity}")
     
     if qty <= 0:
         raise ValidationError(f"Quantity must be greater than 0, got: {qty}")
@@ -97,10 +116,13 @@ def validate_price(price, price_type="price"):
     Raises:
         ValidationError: If price is invalid or non-positive
     """
-    try:
+    if isinstance(price, (int, float)):
         price_val = float(price)
-    except (ValueError, TypeError):
-        raise ValidationError(f"{price_type.capitalize()} must be a number, got: {price}")
+    else:
+        try:
+            price_val = float(price)
+        except _NUMERIC_ERRORS:
+            raise ValidationError(f"{price_type.capitalize()} must be a number, got: {price}")
     
     if price_val <= 0:
         raise ValidationError(f"{price_type.capitalize()} must be greater than 0, got: {price_val}")
@@ -146,10 +168,14 @@ def validate_positive_integer(value, name):
     Raises:
         ValidationError: If value is not a positive integer
     """
-    try:
+    if isinstance(value, int):
+        # int() also turns bool and other int subclasses into a plain int
         int_val = int(value)
-    except (ValueError, TypeError):
-        raise ValidationError(f"{name} must be an integer, got: {value}")
+    else:
+        try:
+            int_val = int(value)
+        except _NUMERIC_ERRORS:
+            raise ValidationError(f"{name} must be an integer, got: {value}")
     
     if int_val <= 0:
         raise ValidationError(f"{name} must be greater than 0, got: {int_val}")
@@ -0,0 +1,196 @@
+"""
+Binance Futures Testnet WebSocket trading API client.
+Places orders over one persistent authenticated connection instead of an HTTPS request per order.
+"""
+
+import os
+import time
+import uuid
+import hmac
+import hashlib
+import itertools
+import threading
+import orjson
+from binance.exceptions import BinanceAPIException
+from dotenv import load_dotenv
+from websockets.exceptions import WebSocketException
+from websockets.sync.client import connect
+from logger import setup_logger
+from rate_limit import order_bucket
+
+# Load environment variables
+load_dotenv()
+
+logger = setup_logger('WebSocketClient')
+
+WS_TRADE_URL = 'wss://testnet.binancefuture.com/ws-fapi/v1'
+
+# Seconds to wait for an order acknowledgement before falling back to REST
+WS_TRADE_TIMEOUT_SECS = 5.0
+
+# Route orders through the WebSocket API by default when set to "true"
+USE_WS_TRADE_API = os.getenv('BINANCE_USE_WS_TRADE_API', '').lower() == 'true'
+
+_WS_CLIENT = None
+_ws_client_lock = threading.Lock()
+
+class WebSocketTradeClient:
+    """Persistent connection to the WebSocket trading API with id-keyed acknowledgements."""
+    
+    def __init__(self, api_key, api_secret, url=WS_TRADE_URL):
+        self.api_key = api_key
+        self.api_secret = api_secret.encode('utf-8')
+        self.closed = False
+        
+        self._conn = connect(url)
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._send_lock = threading.Lock()
+        
+        threading.Thread(target=self._read_responses, daemon=True).start()
+        
+    def _read_responses(self):
+        """Deliver each response to the caller waiting on its request id."""
+        try:
+            for message in self._conn:
+                response = orjson.loads(message)
+                waiter = self._pending.pop(response.get('id'), None)
+                if waiter is not None:
+                    waiter['response'] = response
+                    waiter['event'].set()
+        except WebSocketException as e:
+            logger.warning(f"WebSocket trading connection closed: {e}")
+        finally:
+            self.closed = True
+            
+    def _sign(self, params):
+        """Add apiKey, timestamp and HMAC-SHA256 signature to request params."""
+        signed = {key: str(value) for key, value in params.items()}
+        signed['apiKey'] = self.api_key
+        signed['timestamp'] = str(int(time.time() * 1000))
+        
+        payload = '&'.join(f"{key}={signed[key]}" for key in sorted(signed))
+        signed['signature'] = hmac.new(self.api_secret, payload.encode('utf-8'), hashlib.sha256).hexdigest()
+        return signed
+        
+    def place_order(self, params, timeout=WS_TRADE_TIMEOUT_SECS):
+        """
+        Place an order and wait for its acknowledgement.
+        
+        Args:
+            params (dict): Order parameters as accepted by futures_create_order
+            timeout (float): Seconds to wait for the acknowledgement
+            
+        Returns:
+            dict: Order details from the acknowledgement
+            
+        Raises:
+            WebSocketException: If the request could not be sent
+            TimeoutError: If no acknowledgement arrives within timeout; the
+                order may still have been placed
+            BinanceAPIException: If the order is rejected
+        """
+        order_bucket.acquire()
+        
+        request_id = next(self._ids)
+        waiter = {'event': threading.Event(), 'response': None}
+        self._pending[request_id] = waiter
+        
+        request = {'id': request_id, 'method': 'order.place', 'params': self._sign(params)}
+        try:
+            with self._send_lock:
+                self._conn.send(orjson.dumps(request).decode())
+        except (WebSocketException, OSError):
+            # Nothing reached the exchange, so the token can go to the fallback request
+            self._pending.pop(request_id, None)
+            order_bucket.release()
+            raise
+            
+        if not waiter['event'].wait(timeout):
+            self._pending.pop(request_id, None)
+            raise TimeoutError(f"No acknowledgement for WebSocket order {request_id} after {timeout}s")
+            
+        response = waiter['response']
+        if response.get('status') != 200:
+            raise BinanceAPIException(None, response.get('status'), orjson.dumps(response.get('error', {})).decode())
+            
+        return response['result']
+
+def get_ws_client():
+    """
+    Return the process-wide WebSocket trading client, connecting on first use.
+    
+    Returns:
+        WebSocketTradeClient: Connected trading client
+        
+    Raises:
+        Exception: If API credentials are missing
+    """
+    global _WS_CLIENT
+    
+    with _ws_client_lock:
+        if _WS_CLIENT is None or _WS_CLIENT.closed:
+            api_key = os.getenv('BINANCE_API_KEY')
+            api_secret = os.getenv('BINANCE_API_SECRET')
+            
+            if not api_key or not api_secret:
+                error_msg = "Missing API credentials. Set BINANCE_API_KEY and BINANCE_API_SECRET environment variables."
+                logger.error(error_msg)
+                raise Exception(error_msg)
+                
+            _WS_CLIENT = WebSocketTradeClient(api_key, api_secret)
+            logger.info("Connected to Binance Futures WebSocket trading API")
+            
+        return _WS_CLIENT
+
+def create_order(client, use_ws=None, template=None, **params):
+    """
+    Place an order over the WebSocket trading API, falling back to REST.
+    
+    The REST fallback is only used when the WebSocket request could not be
+    sent. Both routes carry the same newClientOrderId so the exchange can
+    reject a duplicate of the same logical order.
+    
+    Args:
+        client: Authenticated Binance REST client used for the fallback
+        use_ws (bool, optional): Use the WebSocket API; defaults to USE_WS_TRADE_API
+        template (OrderTemplate, optional): Pre-encoded fixed parameters for the REST path
+        **params: Order parameters as accepted by futures_create_order, excluding
+            any already fixed by template
+        
+    Returns:
+        dict: API response with order details
+        
+    Raises:
+        BinanceAPIException: If the order is rejected
+        TimeoutError: If the WebSocket acknowledgement does not arrive in time
+    """
+    if use_ws is None:
+        use_ws = USE_WS_TRADE_API
+        
+    if use_ws:
+        if 'newClientOrderId' not in params and not (template and 'newClientOrderId' in template.params):
+            params['newClientOrderId'] = uuid.uuid4().hex
+            
+        # Connection failures (including handshake timeouts) happen before anything is sent
+        try:
+            ws_client = get_ws_client()
+        except (WebSocketException, OSError) as e:
+            ws_client = None
+            logger.warning(f"WebSocket trading API unavailable, falling back to REST: {e}")
+            
+        if ws_client is not None:
+            try:
+                ws_params = dict(template.params, **params) if template else params
+                return ws_client.place_order(ws_params)
+            except TimeoutError:
+                # TimeoutError is an OSError, but the order may have been placed
+                logger.error(f"No WebSocket acknowledgement for order {params.get('newClientOrderId')}; not retrying over REST")
+                raise
+            except (WebSocketException, OSError) as e:
+                logger.warning(f"WebSocket order could not be sent, falling back to REST: {e}")
+            
+    if template:
+        return template.place(**params)
+    
+    return client.futures_create_order(**params)